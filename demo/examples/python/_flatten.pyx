@@ -0,0 +1,57 @@
+# cython: language_level=3, boundscheck=False
+"""
+딕셔너리 평면화 Cython 확장
+
+@semantic-tags: extension-module, processing-domain
+@description: data_processor._py_flatten_dict 의 컴파일 버전 (빌드: cythonize -i _flatten.pyx)
+"""
+
+from cpython.dict cimport PyDict_Next
+from cpython.ref cimport PyObject
+
+
+cpdef dict flatten_dict(dict data, parent_key='', str sep='_'):
+    """
+    딕셔너리 평면화
+
+    @semantic-tags: utility-function, public-api
+    @param data: 딕셔너리 데이터
+    @param parent_key: 부모 키
+    @param sep: 구분자
+    @return: 평면화된 딕셔너리
+    """
+    cdef dict flat = {}
+    # 순회 중인 딕셔너리, PyDict_Next 위치, 키 접두어를 나란히 스택으로 관리
+    # (접두어가 비어 있는 상태에서 falsy 키 아래로 내려가면 접두어 없이 유지)
+    cdef list dicts = [data]
+    cdef list positions = [0]
+    cdef list prefixes = [f"{parent_key}{sep}" if parent_key else ""]
+    cdef dict current
+    cdef str prefix
+    cdef Py_ssize_t pos
+    cdef PyObject *pkey
+    cdef PyObject *pvalue
+    cdef object k, v
+    cdef bint descended
+
+    while dicts:
+        current = <dict>dicts[-1]
+        pos = positions[-1]
+        prefix = <str>prefixes[-1]
+        descended = False
+        while PyDict_Next(current, &pos, &pkey, &pvalue):
+            k = <object>pkey
+            v = <object>pvalue
+            if isinstance(v, dict):
+                positions[-1] = pos
+                dicts.append(v)
+                positions.append(0)
+                prefixes.append(f"{prefix}{k}{sep}" if prefix or k else "")
+                descended = True
+                break
+            flat[f"{prefix}{k}" if prefix else k] = v
+        if not descended:
+            dicts.pop()
+            positions.pop()
+            prefixes.pop()
+    return flat
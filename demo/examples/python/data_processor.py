@@ -6,29 +6,242 @@ Data Processor Module
 """
 
 import asyncio
+import importlib.util
 import json
 import logging
+import os
+import time
+from collections import deque
+from operator import methodcaller
 from typing import List, Dict, Any, Optional, Union
-from dataclasses import dataclass
+from dataclasses import KW_ONLY, dataclass
 from datetime import datetime
 import pandas as pd
 import numpy as np
 
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:  # orjson 이 없으면 표준 json 파서만 사용
+    _orjson_loads = None
+
+try:
+    import polars as pl
+except ImportError:  # 선택적 의존성: fast_io 경로에서만 사용
+    pl = None
+
 # 로거 설정
 logger = logging.getLogger(__name__)
 
-@dataclass
-class ProcessingResult:
+# clean 연산에서 줄바꿈 문자를 한 번의 translate 로 공백 치환
+_NL_TABLE = str.maketrans({'\n': ' ', '\r': ' '})
+_NL_BYTES_TABLE = bytes.maketrans(b'\n\r', b'  ')
+# orjson 은 64비트 범위를 넘는 정수를 float 로 바꾸므로 19자리 이상 숫자가 있으면 json 사용
+# (숫자를 모두 "0" 으로 바꾼 뒤 연속된 19개를 부분 문자열 검색, 정규식보다 훨씬 빠름)
+_DIGITS_TO_ZERO = str.maketrans("123456789", "000000000")
+_LONG_DIGIT_RUN = "0" * 19
+_DIGITS_TO_ZERO_BYTES = bytes.maketrans(b"123456789", b"000000000")
+_LONG_DIGIT_RUN_BYTES = b"0" * 19
+# 처리 기록 최대 보관 개수 기본값 (config["history_limit"] 로 변경 가능, None 이면 무제한)
+_DEFAULT_HISTORY_LIMIT = 10_000
+# history_limit 이 None 일 때 통계 버퍼의 초기 크기 (가득 차면 두 배로 확장)
+_UNBOUNDED_HISTORY_INITIAL_CAPACITY = 1024
+# pyarrow 가 설치되어 있으면 멀티스레드 pyarrow CSV 파서 사용
+_CSV_ENGINE = "pyarrow" if importlib.util.find_spec("pyarrow") else "c"
+
+# 연산별 처리 함수들 (DataProcessor 가 연산 이름 -> 함수 테이블로 디스패치, flatten 은 메서드 경유)
+def _identity(data: Any) -> Any:
+    """
+    알 수 없는 연산은 입력을 그대로 반환
+
+    @semantic-tags: utility-function, private-function
+    """
+    return data
+
+def _has_long_digit_run(data: Union[str, bytes]) -> bool:
+    """
+    19자리 이상 연속된 숫자가 있는지 검사
+
+    @semantic-tags: utility-function, private-function
+    @param data: JSON 문자열 또는 UTF-8 bytes
+    @return: 연속 숫자 존재 여부
+    """
+    if isinstance(data, bytes):
+        return _LONG_DIGIT_RUN_BYTES in data.translate(_DIGITS_TO_ZERO_BYTES)
+    if data.isascii():
+        return _LONG_DIGIT_RUN in data.translate(_DIGITS_TO_ZERO)
+    # 비 ASCII str 의 translate 는 문자마다 테이블 조회를 해서 파싱보다 느리므로 bytes 로 검사
+    return _LONG_DIGIT_RUN_BYTES in data.encode("utf-8", "surrogatepass").translate(
+        _DIGITS_TO_ZERO_BYTES
+    )
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """
+    JSON 파싱 (orjson 우선, json.loads 와 같은 결과가 보장되지 않는 입력은 json 사용)
+
+    큰 정수가 있을 수 있는 입력은 처음부터 json.loads 로 파싱하고, orjson 이 거부하는
+    입력(NaN, Infinity, 1e400 등)은 json.loads 로 다시 시도
+
+    @semantic-tags: utility-function, private-function
+    @param data: JSON 문자열 또는 UTF-8 bytes
+    @return: 파싱된 객체
+    """
+    if _orjson_loads is not None and not _has_long_digit_run(data):
+        try:
+            return _orjson_loads(data)
+        except ValueError:  # 단독 surrogate 등 orjson 이 거부하는 입력은 json 으로 처리
+            pass
+    return json.loads(data)
+
+def _parse_json(data: Union[str, bytes]) -> Any:
+    """
+    JSON 문자열 파싱 (실패 시 원본 보존)
+
+    bytes 입력은 디코딩 없이 그대로 파서에 전달
+
+    @semantic-tags: utility-function, private-function
+    """
+    try:
+        return _json_loads(data)
+    except (json.JSONDecodeError, UnicodeDecodeError):  # UnicodeDecodeError: 잘못된 UTF-8 bytes 입력
+        return {"raw": data, "parsed": False}
+
+def _clean_string(data: Union[str, bytes]) -> Union[str, bytes]:
+    """
+    앞뒤 공백 제거 및 줄바꿈을 공백으로 치환
+
+    @semantic-tags: utility-function, private-function
+    """
+    if isinstance(data, bytes):
+        return data.strip().translate(_NL_BYTES_TABLE)
+    return data.strip().translate(_NL_TABLE)
+
+def _upper_list(data: List) -> List:
+    """
+    리스트 내 문자열 대문자 변환
+
+    @semantic-tags: utility-function, private-function
+    """
+    return [item.upper() if isinstance(item, str) else item for item in data]
+
+def _unique_list(data: List) -> List:
+    """
+    리스트 중복 제거
+
+    @semantic-tags: utility-function, private-function
+    """
+    # 입력 순서를 유지하며 한 번의 C 레벨 패스로 중복 제거
+    return list(dict.fromkeys(data))
+
+def _upper_keys(data: Dict) -> Dict:
+    """
+    딕셔너리 키 대문자 변환
+
+    @semantic-tags: utility-function, private-function
+    """
+    return {k.upper(): v for k, v in data.items()}
+
+def _py_flatten_dict(data: Dict, parent_key: str = '', sep: str = '_') -> Dict:
+    """
+    딕셔너리 평면화 (순수 파이썬 구현)
+
+    @semantic-tags: utility-function, private-function
+    @param data: 딕셔너리 데이터
+    @param parent_key: 부모 키
+    @param sep: 구분자
+    @return: 평면화된 딕셔너리
+    """
+    flat = {}
+    # 재귀 대신 이터레이터 스택으로 순회하고, 키 접두어는 하위 딕셔너리마다 한 번만 만들어
+    # 스택에 함께 보관 (리프에서는 접두어 + 키 한 번의 포맷만 수행)
+    # 접두어가 비어 있는 상태에서 falsy 키("", 0 등) 아래로 내려가면 접두어 없이 유지
+    stack = deque([(iter(data.items()), f"{parent_key}{sep}" if parent_key else "")])
+    while stack:
+        items, prefix = stack[-1]
+        for k, v in items:
+            if isinstance(v, dict):
+                stack.append((iter(v.items()), f"{prefix}{k}{sep}" if prefix or k else ""))
+                break
+            flat[f"{prefix}{k}" if prefix else k] = v
+        else:
+            stack.pop()
+    return flat
+
+try:
+    from _flatten import flatten_dict as _flatten_impl
+except ImportError:  # Cython 확장(_flatten.pyx)이 빌드되지 않았으면 순수 파이썬 구현 사용
+    _flatten_impl = _py_flatten_dict
+
+_STRING_OPS = {
+    "transform": methodcaller("upper"),
+    "parse": _parse_json,
+    "clean": _clean_string,
+}
+
+_LIST_OPS = {
+    "transform": _upper_list,
+    "filter": lambda data: [item for item in data if item is not None],
+    "sort": sorted,
+    "unique": _unique_list,
+}
+
+_DICT_OPS = {
+    "transform": _upper_keys,
+    "filter": lambda data: {k: v for k, v in data.items() if v is not None},
+}
+
+class _MetadataCache:
+    """
+    ProcessingResult 의 metadata 캐시 슬롯 (dataclass 필드에 포함되지 않도록 베이스 클래스에 둠)
+    
+    @semantic-tags: utility-class, private-class
+    """
+    __slots__ = ("_metadata",)
+
+@dataclass(slots=True, frozen=True)
+class ProcessingResult(_MetadataCache):
     """
     데이터 처리 결과를 담는 클래스
     
+    metadata 는 필드가 아닌 프로퍼티이므로 dataclasses.asdict()/fields() 에는 포함되지 않고,
+    대신 operation, input_type, error 필드가 포함됨
+    
     @semantic-tags: data-class, result-domain, public-api
     """
     success: bool
     data: Any
-    metadata: Dict[str, Any]
     timestamp: datetime
     processing_time: float
+    # 이전의 위치 인자 호출 ProcessingResult(success, data, metadata, timestamp, time) 이
+    # 필드를 밀려 받지 않고 TypeError 가 나도록 새 필드는 키워드 전용
+    _: KW_ONLY
+    operation: Optional[str] = None
+    input_type: Optional[str] = None
+    error: Optional[str] = None
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """
+        처리 메타데이터 (처음 접근할 때 생성하여 캐시)
+        
+        @semantic-tags: property-method, public-api
+        @return: 메타데이터 딕셔너리
+        """
+        try:
+            return self._metadata
+        except AttributeError:
+            pass
+        if self.error is not None:
+            metadata = {"error": self.error}
+        else:
+            metadata = {
+                "operation": self.operation,
+                "input_type": self.input_type,
+                "output_type": type(self.data).__name__,
+                "processing_time": self.processing_time
+            }
+        # frozen 인스턴스이므로 캐시 슬롯은 object.__setattr__ 로 기록
+        object.__setattr__(self, "_metadata", metadata)
+        return metadata
 
 class DataProcessor:
     """
@@ -45,10 +258,21 @@ class DataProcessor:
         @param config: 설정 딕셔너리
         """
         self.config = config or {}
-        self.processing_history = []
+        history_limit = self.config.get("history_limit", _DEFAULT_HISTORY_LIMIT)
+        # 오래된 기록부터 자동으로 버려지도록 길이 제한이 있는 deque 사용
+        self.processing_history = deque(maxlen=history_limit)
+        # 통계용 성공 여부/처리 시간은 같은 크기의 NumPy 링 버퍼에 따로 보관
+        self._hist_bounded = history_limit is not None
+        capacity = history_limit if self._hist_bounded else _UNBOUNDED_HISTORY_INITIAL_CAPACITY
+        self._hist_success = np.zeros(capacity, dtype=np.uint8)
+        self._hist_time = np.zeros(capacity, dtype=np.float64)
+        self._hist_idx = 0
+        self._hist_len = 0
+        # 버퍼에 마지막으로 기록한 결과 (processing_history 가 외부에서 바뀌었는지 판단용)
+        self._hist_last = None
         self.logger = logging.getLogger(self.__class__.__name__)
     
-    async def process_data(self, data: Union[List, Dict, str], 
+    async def process_data(self, data: Union[List, Dict, str, bytes], 
                           operation: str = "transform") -> ProcessingResult:
         """
         데이터 처리 메인 메서드
@@ -58,37 +282,36 @@ class DataProcessor:
         @param operation: 수행할 연산
         @return: 처리 결과
         """
+        # 경과 시간은 단조 시계로 측정하고, datetime 은 timestamp 필드용으로 한 번만 생성
+        start_ns = time.perf_counter_ns()
         start_time = datetime.now()
         
         try:
             self.logger.info(f"Starting data processing: {operation}")
             
             # 데이터 타입에 따른 처리
-            if isinstance(data, str):
-                result_data = await self._process_string_data(data, operation)
+            if isinstance(data, (str, bytes)):
+                result_data = self._process_string_data(data, operation)
             elif isinstance(data, list):
-                result_data = await self._process_list_data(data, operation)
+                result_data = self._process_list_data(data, operation)
             elif isinstance(data, dict):
-                result_data = await self._process_dict_data(data, operation)
+                result_data = self._process_dict_data(data, operation)
             else:
                 raise ValueError(f"Unsupported data type: {type(data)}")
             
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = (time.perf_counter_ns() - start_ns) * 1e-9
             
+            # metadata 딕셔너리는 result.metadata 에 처음 접근할 때 생성됨
             result = ProcessingResult(
                 success=True,
                 data=result_data,
-                metadata={
-                    "operation": operation,
-                    "input_type": type(data).__name__,
-                    "output_type": type(result_data).__name__,
-                    "processing_time": processing_time
-                },
                 timestamp=start_time,
-                processing_time=processing_time
+                processing_time=processing_time,
+                operation=operation,
+                input_type=type(data).__name__
             )
             
-            self.processing_history.append(result)
+            self._record_history(result)
             self.logger.info(f"Data processing completed: {operation}")
             
             return result
@@ -98,33 +321,23 @@ class DataProcessor:
             return ProcessingResult(
                 success=False,
                 data=None,
-                metadata={"error": str(e)},
                 timestamp=start_time,
-                processing_time=(datetime.now() - start_time).total_seconds()
+                processing_time=(time.perf_counter_ns() - start_ns) * 1e-9,
+                error=str(e)
             )
     
-    async def _process_string_data(self, data: str, operation: str) -> Any:
+    def _process_string_data(self, data: Union[str, bytes], operation: str) -> Any:
         """
         문자열 데이터 처리
         
         @semantic-tags: process-method, private-method
-        @param data: 문자열 데이터
+        @param data: 문자열 데이터 (str 또는 UTF-8 bytes)
         @param operation: 수행할 연산
         @return: 처리된 데이터
         """
-        if operation == "transform":
-            return data.upper()
-        elif operation == "parse":
-            try:
-                return json.loads(data)
-            except json.JSONDecodeError:
-                return {"raw": data, "parsed": False}
-        elif operation == "clean":
-            return data.strip().replace('\n', ' ').replace('\r', ' ')
-        else:
-            return data
+        return _STRING_OPS.get(operation, _identity)(data)
     
-    async def _process_list_data(self, data: List, operation: str) -> Any:
+    def _process_list_data(self, data: List, operation: str) -> Any:
         """
         리스트 데이터 처리
         
@@ -133,18 +346,9 @@ class DataProcessor:
         @param operation: 수행할 연산
         @return: 처리된 데이터
         """
-        if operation == "transform":
-            return [item.upper() if isinstance(item, str) else item for item in data]
-        elif operation == "filter":
-            return [item for item in data if item is not None]
-        elif operation == "sort":
-            return sorted(data)
-        elif operation == "unique":
-            return list(set(data))
-        else:
-            return data
+        return _LIST_OPS.get(operation, _identity)(data)
     
-    async def _process_dict_data(self, data: Dict, operation: str) -> Any:
+    def _process_dict_data(self, data: Dict, operation: str) -> Any:
         """
         딕셔너리 데이터 처리
         
@@ -153,14 +357,10 @@ class DataProcessor:
         @param operation: 수행할 연산
         @return: 처리된 데이터
         """
-        if operation == "transform":
-            return {k.upper(): v for k, v in data.items()}
-        elif operation == "filter":
-            return {k: v for k, v in data.items() if v is not None}
-        elif operation == "flatten":
+        if operation == "flatten":
+            # 서브클래스에서 _flatten_dict 를 재정의할 수 있도록 메서드를 거쳐 호출
             return self._flatten_dict(data)
-        else:
-            return data
+        return _DICT_OPS.get(operation, _identity)(data)
     
     def _flatten_dict(self, data: Dict, parent_key: str = '', sep: str = '_') -> Dict:
         """
@@ -172,14 +372,58 @@ class DataProcessor:
         @param sep: 구분자
         @return: 평면화된 딕셔너리
         """
-        items = []
-        for k, v in data.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            if isinstance(v, dict):
-                items.extend(self._flatten_dict(v, new_key, sep=sep).items())
-            else:
-                items.append((new_key, v))
-        return dict(items)
+        return _flatten_impl(data, parent_key, sep)
+    
+    def _record_history(self, result: ProcessingResult) -> None:
+        """
+        처리 결과를 기록 및 통계 링 버퍼에 추가
+        
+        @semantic-tags: history-method, private-method
+        @param result: 처리 결과
+        """
+        self._sync_statistics()
+        self.processing_history.append(result)
+        capacity = len(self._hist_time)
+        if not self._hist_bounded and self._hist_len == capacity:
+            # 무제한 기록: 덮어쓰지 않고 버퍼를 두 배로 늘린 뒤 끝에 이어서 기록
+            self._hist_success = np.concatenate((self._hist_success, np.zeros_like(self._hist_success)))
+            self._hist_time = np.concatenate((self._hist_time, np.zeros_like(self._hist_time)))
+            self._hist_idx = self._hist_len
+            capacity = len(self._hist_time)
+        self._hist_last = result
+        if not capacity:
+            return
+        self._hist_success[self._hist_idx] = result.success
+        self._hist_time[self._hist_idx] = result.processing_time
+        self._hist_idx = (self._hist_idx + 1) % capacity
+        self._hist_len = min(self._hist_len + 1, capacity)
+    
+    def _sync_statistics(self) -> None:
+        """
+        processing_history 가 외부에서 직접 변경되었으면 통계 버퍼를 기록 기준으로 재구성
+        
+        길이와 마지막 항목만 비교하므로 평소에는 O(1), 재구성할 때만 O(n)
+        
+        @semantic-tags: history-method, private-method
+        """
+        history = self.processing_history
+        if len(history) == self._hist_len and (not history or history[-1] is self._hist_last):
+            return
+        capacity = len(self._hist_time)
+        if self._hist_bounded:
+            kept = list(history)[-capacity:] if capacity else []
+        else:
+            kept = list(history)
+            if len(kept) > capacity:
+                capacity = max(capacity * 2, len(kept))
+                self._hist_success = np.zeros(capacity, dtype=np.uint8)
+                self._hist_time = np.zeros(capacity, dtype=np.float64)
+        count = len(kept)
+        self._hist_success[:count] = [result.success for result in kept]
+        self._hist_time[:count] = [result.processing_time for result in kept]
+        self._hist_len = count
+        self._hist_idx = count % capacity if capacity else 0
+        self._hist_last = history[-1] if history else None
     
     def get_processing_history(self) -> List[ProcessingResult]:
         """
@@ -188,7 +432,7 @@ class DataProcessor:
         @semantic-tags: history-method, public-api
         @return: 처리 기록 리스트
         """
-        return self.processing_history.copy()
+        return list(self.processing_history)
     
     def clear_history(self) -> None:
         """
@@ -197,6 +441,9 @@ class DataProcessor:
         @semantic-tags: reset-method, public-api
         """
         self.processing_history.clear()
+        self._hist_idx = 0
+        self._hist_len = 0
+        self._hist_last = None
         self.logger.info("Processing history cleared")
     
     def get_statistics(self) -> Dict[str, Any]:
@@ -206,14 +453,16 @@ class DataProcessor:
         @semantic-tags: stats-method, public-api
         @return: 처리 통계 딕셔너리
         """
-        if not self.processing_history:
+        self._sync_statistics()
+        if not self._hist_len:
             return {"total_operations": 0, "success_rate": 0.0}
         
-        total_operations = len(self.processing_history)
-        successful_operations = sum(1 for result in self.processing_history if result.success)
-        success_rate = successful_operations / total_operations
+        # 링 버퍼의 유효 구간만 벡터 연산으로 합산
+        total_operations = self._hist_len
+        successful_operations = int(self._hist_success[:total_operations].sum())
+        total_processing_time = float(self._hist_time[:total_operations].sum())
         
-        total_processing_time = sum(result.processing_time for result in self.processing_history)
+        success_rate = successful_operations / total_operations
         average_processing_time = total_processing_time / total_operations
         
         return {
@@ -224,17 +473,53 @@ class DataProcessor:
             "average_processing_time": average_processing_time
         }
 
+def _read_csv(file_path: str) -> pd.DataFrame:
+    """
+    CSV 파일 읽기 (경로 입력은 pyarrow 엔진 우선, 실패하면 C 엔진으로 다시 읽음)
+
+    pyarrow 엔진이 오래되어 사용할 수 없거나(ImportError), C 엔진은 허용하는 입력을
+    거부하면(ValueError, 예: 열 개수가 모자란 행은 C 엔진이 NaN 으로 채움) C 엔진으로
+    다시 읽음. 다시 읽을 수 있도록 pyarrow 엔진은 파일 경로 입력에만 사용하고
+    file-like 객체는 처음부터 C 엔진으로 읽음
+
+    pyarrow 엔진은 C 엔진과 컬럼 타입 추론이 일부 다름 (날짜/문자열 컬럼 등,
+    구체적인 차이는 pandas/pyarrow 버전에 따라 다름)
+
+    @semantic-tags: utility-function, private-function
+    @param file_path: CSV 파일 경로
+    @return: 읽은 DataFrame
+    """
+    if _CSV_ENGINE == "pyarrow" and isinstance(file_path, (str, bytes, os.PathLike)):
+        try:
+            return pd.read_csv(file_path, engine="pyarrow")
+        except (ImportError, ValueError):  # 오래된 pyarrow / pyarrow 만 거부하는 입력 (ParserError 등)
+            pass
+    return pd.read_csv(file_path, engine="c")
+
 # 비동기 데이터 처리 함수들
-async def process_csv_data(file_path: str) -> pd.DataFrame:
+async def process_csv_data(file_path: str, fast_io: bool = False) -> pd.DataFrame:
     """
     CSV 파일 데이터 처리
     
     @semantic-tags: async-function, data-function, public-api
     @param file_path: CSV 파일 경로
-    @return: 처리된 DataFrame
+    @param fast_io: polars 와 pyarrow 가 모두 설치되어 있으면 lazy 쿼리로 읽기/정리를 한 번에 수행.
+        이 경로의 결과는 pandas 경로와 다름: 인덱스가 0부터 다시 매겨지고, 컬럼은 ArrowDtype 이며,
+        빈 필드(null)만 제거되고 NaN 이나 pandas 기본 결측 문자열("NA", "null" 등)은 남음
+    @return: 처리된 DataFrame (pyarrow 엔진으로 읽으면 컬럼 타입이 C 엔진과 다를 수 있음)
     """
     try:
-        df = pd.read_csv(file_path)
+        # to_pandas(use_pyarrow_extension_array=True) 는 pyarrow 가 필요
+        if fast_io and pl is not None and _CSV_ENGINE == "pyarrow":
+            # 결측 행 제거와 중복 제거를 하나의 lazy 쿼리로 합쳐 실행 (행 순서 유지)
+            return (
+                pl.scan_csv(file_path)
+                .drop_nulls()
+                .unique(maintain_order=True)
+                .collect()
+                .to_pandas(use_pyarrow_extension_array=True)
+            )
+        df = _read_csv(file_path)
         # 데이터 정리
         df = df.dropna()
         df = df.drop_duplicates()
@@ -243,17 +528,17 @@ async def process_csv_data(file_path: str) -> pd.DataFrame:
         logger.error(f"CSV processing failed: {str(e)}")
         raise
 
-async def process_json_data(data: Union[str, Dict]) -> Dict:
+async def process_json_data(data: Union[str, bytes, Dict]) -> Dict:
     """
     JSON 데이터 처리
     
     @semantic-tags: async-function, data-function, public-api
-    @param data: JSON 데이터
+    @param data: JSON 데이터 (str, bytes 또는 dict)
     @return: 처리된 딕셔너리
     """
     try:
-        if isinstance(data, str):
-            return json.loads(data)
+        if isinstance(data, (str, bytes)):
+            return _json_loads(data)
         elif isinstance(data, dict):
             return data
         else:
@@ -284,10 +569,21 @@ async def main():
         }
     }
     
-    # 데이터 처리
-    result = await processor.process_data(test_data, "transform")
-    print(f"Processing result: {result.success}")
-    print(f"Processed data: {result.data}")
+    # 처리할 작업 목록 (데이터, 연산)
+    workloads = [
+        (test_data, "transform"),
+        (test_data, "flatten"),
+        (test_data["users"][0], "filter"),
+        ('{"status": "ok"}', "parse"),
+    ]
+    
+    # 데이터 처리 (모든 작업을 동시에 실행)
+    results = await asyncio.gather(
+        *(processor.process_data(data, operation) for data, operation in workloads)
+    )
+    for (_, operation), result in zip(workloads, results):
+        print(f"Processing result [{operation}]: {result.success}")
+        print(f"Processed data [{operation}]: {result.data}")
     
     # 통계 출력
     stats = processor.get_statistics()